@@ -1,11 +1,15 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+import asyncio
 import os
-import pickle
-from typing import Dict, Any, List
+import orjson
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
 import logging
 from pydantic import BaseModel
-from utils.text_to_speech import TextToSpeechService
-import shutil
+from utils.text_to_speech import get_service
+from utils.storage import ANALYSIS_EXTENSION, AUDIO_EXTENSION, read_analysis_json
 
 # Configure logging
 logging.basicConfig(
@@ -14,10 +18,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="News Sentiment Analysis API")
+app = FastAPI(title="News Sentiment Analysis API", default_response_class=ORJSONResponse)
 
-# Initialize Text-to-Speech service
-tts_service = TextToSpeechService()
+# Company list cached against the output directory's mtime
+_COMPANIES_CACHE = {"mtime": None, "value": []}
+
+# Let clients reuse responses briefly, then revalidate with ETag/Last-Modified
+CACHE_CONTROL = "max-age=60, stale-while-revalidate=300"
 
 # Create a model for responses
 class CompanyResponse(BaseModel):
@@ -27,31 +34,106 @@ class CompanyResponse(BaseModel):
 class CompanyListResponse(BaseModel):
     companies: List[str]
 
+@lru_cache(maxsize=256)
+def _load_company(path: str, mtime: int) -> bytes:
+    """
+    Load and decompress a company's raw JSON analysis from disk.
+    
+    The file's mtime is part of the cache key, so entries are invalidated
+    automatically when the cron job rewrites the file.
+    """
+    return read_analysis_json(path)
+
+def _load_company_cached(path: str, mtime: int) -> Tuple[bytes, str]:
+    """
+    Load a company's raw JSON analysis through the in-process cache.
+    
+    Args:
+        path: Path to the company's analysis file
+        mtime: The file's st_mtime_ns
+        
+    Returns:
+        Tuple of (raw_json, cache_status) where cache_status is "HIT" or "MISS"
+    """
+    hits = _load_company.cache_info().hits
+    raw_json = _load_company(path, mtime)
+    return raw_json, "HIT" if _load_company.cache_info().hits > hits else "MISS"
+
+def _validation_headers(mtime: int) -> Dict[str, str]:
+    """
+    Build the caching headers for a resource last modified at mtime.
+    
+    Args:
+        mtime: Modification time of the underlying file in nanoseconds
+        
+    Returns:
+        Dictionary with ETag, Last-Modified and Cache-Control headers
+    """
+    return {
+        "ETag": f'"{mtime}"',
+        "Last-Modified": formatdate(mtime / 1e9, usegmt=True),
+        "Cache-Control": CACHE_CONTROL
+    }
+
+def _is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """
+    Check whether the client's cached copy is still current.
+    
+    Args:
+        request: Incoming request with optional conditional headers
+        headers: Validation headers of the current resource
+        
+    Returns:
+        True if a 304 Not Modified response can be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in etags or headers["ETag"] in etags
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            return parsedate_to_datetime(headers["Last-Modified"]) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    
+    return False
+
 @app.get("/", response_model=Dict[str, str])
 async def root():
     """Root endpoint to check if API is running"""
     return {"message": "News Sentiment Analysis API is running"}
 
 @app.get("/companies", response_model=CompanyListResponse)
-async def get_companies():
+async def get_companies(request: Request, response: Response):
     """Get a list of all available companies"""
     try:
-        # Get all pickle files in the output directory
+        # Get all analysis files in the output directory
         output_dir = "data/output"
         if not os.path.exists(output_dir):
             return {"companies": []}
             
-        company_files = [f for f in os.listdir(output_dir) if f.endswith('.pkl')]
-        companies = [os.path.splitext(f)[0].replace('_', ' ').title() for f in company_files]
+        # The directory only changes when the cron job writes new files
+        mtime = os.stat(output_dir).st_mtime_ns
+        headers = _validation_headers(mtime)
+        if _is_not_modified(request, headers):
+            return Response(status_code=304, headers=headers)
+        
+        if _COMPANIES_CACHE["mtime"] != mtime:
+            with os.scandir(output_dir) as entries:
+                companies = [e.name[:-len(ANALYSIS_EXTENSION)].replace('_', ' ').title() for e in entries if e.name.endswith(ANALYSIS_EXTENSION)]
+            _COMPANIES_CACHE.update(mtime=mtime, value=companies)
         
-        return {"companies": companies}
+        response.headers.update(headers)
+        return {"companies": _COMPANIES_CACHE["value"]}
     
     except Exception as e:
         logger.error(f"Error getting companies: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/company/{company_name}", response_model=CompanyResponse)
-async def get_company_data(company_name: str):
+async def get_company_data(company_name: str, request: Request):
     """
     Get sentiment analysis data for a specific company.
     
@@ -63,18 +145,25 @@ async def get_company_data(company_name: str):
     """
     try:
         # Normalize the company name
-        company_file = company_name.lower().replace(' ', '_') + '.pkl'
+        company_file = company_name.lower().replace(' ', '_') + ANALYSIS_EXTENSION
         file_path = f"data/output/{company_file}"
         
         # Check if the file exists
         if not os.path.exists(file_path):
             raise HTTPException(status_code=404, detail=f"Data for {company_name} not found")
         
-        # Load the data from the pickle file
-        with open(file_path, 'rb') as f:
-            data = pickle.load(f)
+        # Answer conditional requests without touching the file contents
+        mtime = os.stat(file_path).st_mtime_ns
+        headers = _validation_headers(mtime)
+        if _is_not_modified(request, headers):
+            return Response(status_code=304, headers=headers)
         
-        return {"company": company_name, "data": data}
+        # Load the data from the analysis file
+        raw_json, cache_status = _load_company_cached(file_path, mtime)
+        
+        # The stored analysis is already JSON, so embed its bytes as-is
+        content = b'{"company":' + orjson.dumps(company_name) + b',"data":' + raw_json + b'}'
+        return Response(content=content, media_type="application/json", headers={**headers, "X-Cache": cache_status})
     
     except HTTPException:
         raise
@@ -83,45 +172,66 @@ async def get_company_data(company_name: str):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/tts/{company_name}")
-async def get_tts(company_name: str):
+async def get_tts(company_name: str, request: Request):
     """
-    Generate text-to-speech for a company's sentiment analysis in Hindi.
+    Get text-to-speech for a company's sentiment analysis in Hindi.
+    
+    The audio pre-rendered by the cron job is served when available; otherwise
+    it is generated on demand.
     
     Args:
         company_name: Name of the company
         
     Returns:
-        Path to the audio file
+        The MP3 audio
     """
     try:
         # Get the company data
-        company_file = company_name.lower().replace(' ', '_') + '.pkl'
-        file_path = f"data/output/{company_file}"
+        company_stem = company_name.lower().replace(' ', '_')
+        file_path = f"data/output/{company_stem}{ANALYSIS_EXTENSION}"
+        audio_file = f"data/output/{company_stem}{AUDIO_EXTENSION}"
         
         # Check if the file exists
         if not os.path.exists(file_path):
             raise HTTPException(status_code=404, detail=f"Data for {company_name} not found")
         
-        # Load the data from the pickle file
-        with open(file_path, 'rb') as f:
-            data = pickle.load(f)
+        # Serve the pre-rendered audio as a static file, unless it predates the analysis
+        # (the cron job may have died between saving the analysis and its audio)
+        analysis_mtime = os.stat(file_path).st_mtime_ns
+        audio_mtime = os.stat(audio_file).st_mtime_ns if os.path.exists(audio_file) else None
+        if audio_mtime is not None and audio_mtime >= analysis_mtime:
+            headers = _validation_headers(audio_mtime)
+            if _is_not_modified(request, headers):
+                return Response(status_code=304, headers=headers)
+            return FileResponse(audio_file, media_type="audio/mpeg", headers=headers)
+        
+        # Load the data from the analysis file
+        raw_json, cache_status = _load_company_cached(file_path, analysis_mtime)
+        data = orjson.loads(raw_json)
         
         # Get the final sentiment analysis
         sentiment_text = data.get("Final Sentiment Analysis", "No sentiment analysis available")
         
-        # Translate to Hindi
-        hindi_text = tts_service.translate_to_hindi(sentiment_text)
+        # Fall back to generating the audio in worker threads so the event loop stays free;
+        # the shared service is only built (off the loop) the first time this path is hit
+        tts_service = await asyncio.to_thread(get_service)
+        hindi_text = await asyncio.to_thread(tts_service.translate_to_hindi, sentiment_text)
+        audio_stream = tts_service.text_to_speech_stream(hindi_text)
         
-        # Generate speech
-        audio_path, temp_dir = tts_service.text_to_speech(hindi_text)
-        
-        if not audio_path:
+        # Wait for the first chunk so a failure can still be reported as an error status
+        try:
+            first_chunk = await audio_stream.__anext__()
+        except Exception as e:
+            logger.error(f"Error generating speech for {company_name}: {e}")
             raise HTTPException(status_code=500, detail="Failed to generate speech")
         
-        # In a real application, you would return the audio file or a URL to it
-        # For this example, we'll just return the path
-        # Note: Normally you would handle the temporary file cleanup properly
-        return {"audio_path": audio_path}
+        async def stream_audio():
+            yield first_chunk
+            async for chunk in audio_stream:
+                yield chunk
+        
+        # Stream the audio as it is synthesized rather than waiting for the whole file
+        return StreamingResponse(stream_audio(), media_type="audio/mpeg", headers={"X-Cache": cache_status})
     
     except HTTPException:
         raise
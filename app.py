@@ -1,9 +1,8 @@
 import streamlit as st
 import pandas as pd
-import os
 import requests
 import json
-import base64
+from cachecontrol import CacheControl
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,30 +18,32 @@ st.set_page_config(
     layout="wide"
 )
 
+# HTTP session that honours the API's Cache-Control and revalidates with ETags;
+# cached so it (and the ETags it has seen) survives Streamlit's script reruns
+@st.cache_resource
+def get_session():
+    """Get the shared caching HTTP session for API requests"""
+    return CacheControl(requests.Session())
+
 # Function to get audio data
 def get_audio_content(company_name):
     """Get audio content for a company from the API"""
     try:
-        response = requests.get(f"{API_URL}/tts/{company_name}")
+        response = get_session().get(f"{API_URL}/tts/{company_name}")
         response.raise_for_status()
         
-        # Get the audio file path from the response
-        audio_path = response.json().get("audio_path")
-        
-        if audio_path and os.path.exists(audio_path):
-            with open(audio_path, "rb") as audio_file:
-                return audio_file.read()
-        return None
+        # The API streams the MP3 back directly
+        return response.content or None
     except Exception as e:
         st.error(f"Error fetching audio: {e}")
         return None
 
 # Function to get list of companies
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_resource(ttl=300)  # Cache for 5 minutes, shared read-only across sessions
 def get_companies():
     """Get list of available companies from the API"""
     try:
-        response = requests.get(f"{API_URL}/companies")
+        response = get_session().get(f"{API_URL}/companies")
         response.raise_for_status()
         return response.json().get("companies", [])
     except Exception as e:
@@ -50,11 +51,13 @@ def get_companies():
         return []
 
 # Function to get company data
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+# cache_resource shares one object across sessions instead of deep-copying it on
+# every hit like cache_data does; the UI below only reads from the returned dict
+@st.cache_resource(ttl=300)  # Cache for 5 minutes
 def get_company_data(company_name):
     """Get sentiment analysis data for a company from the API"""
     try:
-        response = requests.get(f"{API_URL}/company/{company_name}")
+        response = get_session().get(f"{API_URL}/company/{company_name}")
         response.raise_for_status()
         return response.json().get("data", {})
     except requests.exceptions.RequestException as e:
@@ -95,15 +98,7 @@ else:
             audio_content = get_audio_content(selected_company)
             
             if audio_content:
-                # Create a base64 encoded string for the audio
-                b64 = base64.b64encode(audio_content).decode()
-                audio_html = f"""
-                <audio controls>
-                    <source src="data:audio/mp3;base64,{b64}" type="audio/mp3">
-                    Your browser does not support the audio element.
-                </audio>
-                """
-                st.markdown(audio_html, unsafe_allow_html=True)
+                st.audio(audio_content, format="audio/mp3")
             else:
                 st.warning("Audio not available. Please check the API.")
             
@@ -1,9 +1,14 @@
+import asyncio
+import hashlib
 import os
-import pickle
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 from utils.news_scraper import NewsScraper
 from utils.gemini_service import GeminiService
-from typing import List, Dict, Any
+from utils.article_cache import ArticleCache
+from utils.text_to_speech import TextToSpeechService, get_service
+from utils.storage import ANALYSIS_EXTENSION, AUDIO_EXTENSION, save_analysis, write_atomic
+from typing import List, Dict, Any, Optional
 import logging
 from dotenv import load_dotenv
 
@@ -21,37 +26,60 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-def process_company(company_name: str) -> Dict[str, Any]:
+# Number of companies processed concurrently; the work is mostly network-bound
+MAX_WORKERS = 8
+
+# Shared across companies so the pooled search connections are reused
+news_scraper = NewsScraper()
+
+# Shared so the Gemini client is configured and its response cache opened only once
+gemini_service = GeminiService()
+
+def process_company(company_name: str, article_cache: Optional[ArticleCache] = None) -> Dict[str, Any]:
     """
     Process a single company.
     
     Args:
         company_name: Name of the company to process
+        article_cache: Cache of previously extracted articles, shared across companies
         
     Returns:
         Dictionary with analysis results
     """
     logger.info(f"Processing company: {company_name}")
     
-    # Initialize services
-    news_scraper = NewsScraper()
-    gemini_service = GeminiService()
-    
     # Step 1: Fetch article URLs
     article_urls = news_scraper.search_google_news(company_name)
     logger.info(f"Found {len(article_urls)} articles for {company_name}")
     
-    # Step 2: Extract content from each article
-    articles = []
-    for url in article_urls:
-        logger.info(f"Extracting content from: {url}")
-        article = news_scraper.extract_article_content(url)
+    # Step 2: Reuse articles already extracted for this or another company
+    extracted = []
+    if article_cache is not None:
+        cached = [article_cache.get(url) for url in article_urls]
+        extracted = [article for article in cached if article is not None]
+        article_urls = [url for url, article in zip(article_urls, cached) if article is None]
+        logger.info(f"Reused {len(extracted)} cached articles for {company_name}")
+    
+    # Step 3: Extract content from the remaining articles concurrently
+    logger.info(f"Extracting content from {len(article_urls)} URLs")
+    for article in asyncio.run(news_scraper.extract_articles(article_urls)):
         if article['title'] and article['content']:
+            extracted.append(article)
+            if article_cache is not None:
+                article_cache.set(article['url'], article)
+    
+    # Drop syndicated copies of the same article published under different URLs
+    articles = []
+    content_hashes = set()
+    for article in extracted:
+        content_hash = hashlib.blake2b(article['content'].encode()).digest()
+        if content_hash not in content_hashes:
+            content_hashes.add(content_hash)
             articles.append(article)
     
     logger.info(f"Successfully extracted content from {len(articles)} articles")
     
-    # Step 3: Analyze articles with Gemini
+    # Step 4: Analyze articles with Gemini
     if articles:
         logger.info("Sending articles to Gemini for analysis")
         analysis = gemini_service.analyze_news_articles(company_name, articles)
@@ -64,6 +92,57 @@ def process_company(company_name: str) -> Dict[str, Any]:
             "Final Sentiment Analysis": "No articles found for analysis."
         }
 
+def process_and_save(company: str, safe_name: str, tts_service: TextToSpeechService, article_cache: Optional[ArticleCache] = None) -> str:
+    """
+    Process a single company and save its analysis to disk.
+    
+    Args:
+        company: Name of the company to process
+        safe_name: Filesystem-safe file name stem for the company
+        tts_service: Service used to pre-render the Hindi audio
+        article_cache: Cache of previously extracted articles, shared across companies
+        
+    Returns:
+        Path of the saved analysis file
+    """
+    analysis = process_company(company, article_cache)
+    
+    # Save the analysis as compressed JSON
+    output_file = f"data/output/{safe_name}{ANALYSIS_EXTENSION}"
+    save_analysis(output_file, analysis)
+    logger.info(f"Saved analysis for {company} to {output_file}")
+    
+    # Pre-render the Hindi audio so the API can serve it as a static file
+    audio_file = f"data/output/{safe_name}{AUDIO_EXTENSION}"
+    save_audio(analysis, audio_file, tts_service)
+    return output_file
+
+def save_audio(analysis: Dict[str, Any], audio_file: str, tts_service: TextToSpeechService) -> None:
+    """
+    Translate a company's final sentiment analysis to Hindi and save it as speech.
+    
+    On failure any stale audio from a previous run is removed, so the API
+    falls back to generating it on demand.
+    
+    Args:
+        analysis: Analysis results for the company
+        audio_file: Destination path of the MP3 file
+        tts_service: Service used to translate and synthesize the text
+    """
+    sentiment_text = analysis.get("Final Sentiment Analysis", "No sentiment analysis available")
+    hindi_text = tts_service.translate_to_hindi(sentiment_text)
+    audio = tts_service.text_to_speech_bytes(hindi_text)
+    
+    if not audio:
+        logger.warning(f"Failed to generate speech for {audio_file}")
+        if os.path.exists(audio_file):
+            os.remove(audio_file)
+        return
+    
+    # The API may be serving the previous file, so swap it in atomically
+    write_atomic(audio_file, audio)
+    logger.info(f"Saved Hindi audio to {audio_file}")
+
 def main():
     """Main function to process all companies in the CSV file"""
     logger.info("Starting cron job to process companies")
@@ -99,30 +178,29 @@ def main():
             company_column = company_df.columns[0]
             logger.warning(f"Using first column as company column: '{company_column}'")
             
-        # Get the list of companies
-        company_list = company_df[company_column].tolist()
-        logger.info(f"Loaded {len(company_list)} companies from CSV")
+        # Get the list of companies, skipping empty values
+        names = company_df[company_column].dropna().astype(str)
+        names = names[names.str.len() > 0]
+        if len(names) < len(company_df):
+            logger.warning(f"Skipping {len(company_df) - len(names)} empty company names")
+        logger.info(f"Loaded {len(names)} companies from CSV")
         
-        # Process each company
-        for company in company_list:
-            try:
-                # Skip empty values
-                if pd.isna(company) or not company:
-                    logger.warning("Skipping empty company name")
-                    continue
-                    
-                # Process the company
-                analysis = process_company(company)
-                
-                # Save the analysis to a pickle file
-                safe_name = str(company).lower().replace(' ', '_').replace('/', '_').replace('\\', '_')
-                output_file = f"data/output/{safe_name}.pkl"
-                with open(output_file, 'wb') as f:
-                    pickle.dump(analysis, f)
-                logger.info(f"Saved analysis for {company} to {output_file}")
-            
-            except Exception as e:
-                logger.error(f"Error processing company {company}: {e}")
+        # Build filesystem-safe file names for all companies in one pass
+        safe_names = names.str.lower().str.replace(r'[ /\\]', '_', regex=True)
+        companies = list(zip(names, safe_names))
+        
+        # Build the shared TTS service once here rather than whenever this module is imported
+        tts_service = get_service()
+        
+        # Process companies concurrently; threads (not processes) avoid pickling the Gemini client
+        with ArticleCache("data/article_cache") as article_cache, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(process_and_save, company, safe_name, tts_service, article_cache): company for company, safe_name in companies}
+            for future in as_completed(futures):
+                company = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error processing company {company}: {e}")
     
     except Exception as e:
         logger.error(f"Error in main cron job: {e}")
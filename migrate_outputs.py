@@ -0,0 +1,54 @@
+import os
+import pickle
+import orjson
+import logging
+from utils.storage import ANALYSIS_EXTENSION, save_analysis
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Legacy output formats and how to load them
+LEGACY_LOADERS = {
+    '.pkl': pickle.load,
+    '.json': lambda f: orjson.loads(f.read())
+}
+
+def main(output_dir: str = "data/output"):
+    """
+    One-time migration of legacy pickle and plain JSON outputs to the
+    compressed format served by the API.
+    
+    Legacy files are left in place; only missing compressed files are written.
+    
+    Args:
+        output_dir: Directory containing the cron job's output files
+    """
+    if not os.path.exists(output_dir):
+        logger.error(f"Output directory not found: {output_dir}")
+        return
+    
+    with os.scandir(output_dir) as entries:
+        legacy_files = [e.path for e in entries if os.path.splitext(e.name)[1] in LEGACY_LOADERS]
+    
+    for legacy_file in legacy_files:
+        stem, extension = os.path.splitext(legacy_file)
+        output_file = stem + ANALYSIS_EXTENSION
+        if os.path.exists(output_file):
+            logger.info(f"Skipping {legacy_file}, {output_file} already exists")
+            continue
+        
+        try:
+            with open(legacy_file, 'rb') as f:
+                analysis = LEGACY_LOADERS[extension](f)
+            save_analysis(output_file, analysis)
+            logger.info(f"Migrated {legacy_file} to {output_file}")
+        
+        except Exception as e:
+            logger.error(f"Error migrating {legacy_file}: {e}")
+
+if __name__ == "__main__":
+    main()
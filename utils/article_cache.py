@@ -0,0 +1,50 @@
+from diskcache import Cache
+from typing import Dict, Any, Optional
+
+# How long an extracted article is reused before it is downloaded again
+ARTICLE_CACHE_EXPIRE = 7 * 24 * 3600
+
+class ArticleCache:
+    def __init__(self, path: str = "data/article_cache"):
+        """
+        Initialize a persistent cache of extracted articles keyed by URL.
+        
+        The cache is shared by the cron job's worker threads; diskcache is
+        safe to use from any thread, and old entries expire on their own.
+        
+        Args:
+            path: Directory of the on-disk cache
+        """
+        self.cache = Cache(path)
+    
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a previously extracted article.
+        
+        Args:
+            url: URL of the article
+            
+        Returns:
+            The cached article dictionary, or None if the URL was not seen before
+        """
+        return self.cache.get(url)
+    
+    def set(self, url: str, article: Dict[str, Any]) -> None:
+        """
+        Store an extracted article.
+        
+        Args:
+            url: URL of the article
+            article: Article dictionary with title, content and url
+        """
+        self.cache.set(url, article, expire=ARTICLE_CACHE_EXPIRE)
+    
+    def close(self) -> None:
+        """Close the underlying cache"""
+        self.cache.close()
+    
+    def __enter__(self) -> "ArticleCache":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,15 +1,61 @@
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 import os
+import hashlib
 from typing import List, Dict, Any
 import json
+import textwrap
+from diskcache import Cache
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
+# How long a cached Gemini analysis stays valid
+ANALYSIS_CACHE_EXPIRE = 7 * 24 * 3600
+
+# Gemini model used for the analysis
+MODEL_NAME = 'gemini-1.5-pro'
+
+# Gemini errors that are worth retrying (rate limiting and server-side failures)
+TRANSIENT_GEMINI_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded
+)
+
+# Input token budgets for the analysis prompt (estimated, see _truncate_to_tokens)
+ARTICLE_TOKEN_BUDGET = 1000
+PROMPT_TOKEN_BUDGET = 12000
+BYTES_PER_TOKEN = 4
+
+# Static part of the analysis prompt, built once with whitespace stripped
+ANALYSIS_PROMPT_TEMPLATE = textwrap.dedent("""\
+    Analyze the following news articles about {company_name}. For each article:
+    1. Create a concise summary
+    2. Determine the sentiment (Positive, Negative, or Neutral)
+    3. Extract key topics discussed
+    Then, perform a comparative analysis across all articles to understand:
+    - The distribution of sentiment
+    - Key differences in coverage
+    - Topic overlap between articles
+    Finally, provide an overall sentiment analysis for {company_name} based on these articles.
+    Return your analysis as JSON in the following format:
+    {{"Company": "{company_name}", "Articles": [{{"Title": "Article title", "Summary": "Concise summary", "Sentiment": "Positive/Negative/Neutral", "Topics": ["Topic 1", "Topic 2"]}}], "Comparative Sentiment Score": {{"Sentiment Distribution": {{"Positive": count, "Negative": count, "Neutral": count}}, "Coverage Differences": [{{"Comparison": "Description of difference between articles", "Impact": "Impact of this difference"}}], "Topic Overlap": {{"Common Topics": ["Topic shared across articles"], "Unique Topics in Article X": ["Topics unique to a specific article"]}}}}, "Final Sentiment Analysis": "Overall sentiment conclusion"}}
+    Here are the articles:""")
+
+# Everything besides the articles that shapes a response; part of the cache key so
+# analyses produced with an older prompt, model or budget are not served again
+ANALYSIS_CACHE_VERSION = hashlib.blake2b(
+    f"{MODEL_NAME}|{ARTICLE_TOKEN_BUDGET}|{PROMPT_TOKEN_BUDGET}|{BYTES_PER_TOKEN}|{ANALYSIS_PROMPT_TEMPLATE}".encode()
+).digest()
 
 class GeminiService:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache_dir: str = "data/llm_cache"):
         """
         Initialize the Gemini service with API key.
         
         Args:
             api_key: Google API key for Gemini
+            cache_dir: Directory for the on-disk cache of analysis responses
         """
         if api_key is None:
 
@@ -20,7 +66,8 @@ class GeminiService:
             raise ValueError("Google API key is required")
         
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-pro')
+        self.model = genai.GenerativeModel(MODEL_NAME)
+        self.cache = Cache(cache_dir)
     
     def analyze_news_articles(self, company_name: str, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -33,12 +80,18 @@ class GeminiService:
         Returns:
             Dictionary with analysis results
         """
+        # Skip Gemini entirely if this exact set of articles was analyzed before
+        cache_key = self._analysis_cache_key(company_name, articles)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Create a prompt for Gemini
         prompt = self._create_analysis_prompt(company_name, articles)
         
         # Send the prompt to Gemini
         try:
-            response = self.model.generate_content(prompt)
+            response = self._generate_content(prompt)
             result = response.text
             
             # Parse the JSON response
@@ -49,6 +102,7 @@ class GeminiService:
                 
                 # Parse the JSON content
                 analysis = json.loads(result)
+                self.cache.set(cache_key, analysis, expire=ANALYSIS_CACHE_EXPIRE)
                 return analysis
             except json.JSONDecodeError as e:
                 print(f"Error parsing Gemini response as JSON: {e}")
@@ -70,6 +124,44 @@ class GeminiService:
                 "Final Sentiment Analysis": "Error analyzing articles."
             }
     
+    @retry(
+        retry=retry_if_exception_type(TRANSIENT_GEMINI_ERRORS),
+        wait=wait_exponential_jitter(1, 30),
+        stop=stop_after_attempt(4),
+        reraise=True
+    )
+    def _generate_content(self, prompt: str):
+        """
+        Call Gemini, retrying rate limits and transient server errors with backoff.
+        
+        Args:
+            prompt: Prompt to send
+            
+        Returns:
+            The Gemini response
+        """
+        return self.model.generate_content(prompt)
+    
+    def _analysis_cache_key(self, company_name: str, articles: List[Dict[str, Any]]) -> str:
+        """
+        Build a stable cache key for a company and its set of articles.
+        
+        The key does not depend on article order, so a re-run over the same
+        articles maps to the same entry; it changes with ANALYSIS_CACHE_VERSION.
+        
+        Args:
+            company_name: Name of the company
+            articles: List of article dictionaries
+            
+        Returns:
+            Hex digest identifying the analysis request
+        """
+        article_digests = sorted(
+            hashlib.blake2b((article.get('title', '') + article.get('content', '')).encode()).digest()
+            for article in articles
+        )
+        return hashlib.blake2b(ANALYSIS_CACHE_VERSION + b'||'.join(article_digests) + company_name.encode()).hexdigest()
+    
     def _create_analysis_prompt(self, company_name: str, articles: List[Dict[str, Any]]) -> str:
         """
         Create a prompt for the Gemini model to analyze news articles.
@@ -81,66 +173,38 @@ class GeminiService:
         Returns:
             Prompt string for Gemini
         """
-        prompt = f"""
-        Analyze the following news articles about {company_name}. For each article:
-        
-        1. Create a concise summary
-        2. Determine the sentiment (Positive, Negative, or Neutral)
-        3. Extract key topics discussed
-        
-        Then, perform a comparative analysis across all articles to understand:
-        - The distribution of sentiment
-        - Key differences in coverage
-        - Topic overlap between articles
-        
-        Finally, provide an overall sentiment analysis for {company_name} based on these articles.
-        
-        Return your analysis in the following JSON format:
-        
-        ```json
-        {{
-            "Company": "{company_name}",
-            "Articles": [
-                {{
-                    "Title": "Article title",
-                    "Summary": "Concise summary",
-                    "Sentiment": "Positive/Negative/Neutral",
-                    "Topics": ["Topic 1", "Topic 2"]
-                }}
-            ],
-            "Comparative Sentiment Score": {{
-                "Sentiment Distribution": {{
-                    "Positive": count,
-                    "Negative": count,
-                    "Neutral": count
-                }},
-                "Coverage Differences": [
-                    {{
-                        "Comparison": "Description of difference between articles",
-                        "Impact": "Impact of this difference"
-                    }}
-                ],
-                "Topic Overlap": {{
-                    "Common Topics": ["Topic shared across articles"],
-                    "Unique Topics in Article X": ["Topics unique to a specific article"]
-                }}
-            }},
-            "Final Sentiment Analysis": "Overall sentiment conclusion"
-        }}
-        ```
-        
-        Here are the articles:
-        """
+        prompt = ANALYSIS_PROMPT_TEMPLATE.format(company_name=company_name)
+        
+        # Share the token budget between articles, capped per article
+        article_budget = min(ARTICLE_TOKEN_BUDGET, PROMPT_TOKEN_BUDGET // max(len(articles), 1))
         
         # Add each article to the prompt
         for i, article in enumerate(articles, 1):
             title = article.get('title', 'No title').replace('"', '\\"')
-            content = article.get('content', 'No content')
-            
-            # Truncate very long articles to avoid exceeding token limits
-            if len(content) > 5000:
-                content = content[:5000] + "..."
+            content = self._truncate_to_tokens(article.get('content', 'No content'), article_budget)
             
             prompt += f"\n\nARTICLE {i} - {title}\n{content}"
         
         return prompt
+    
+    def _truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate text to roughly the given number of tokens.
+        
+        Uses the ~4 UTF-8 bytes per token heuristic rather than a tokenizer
+        round trip, cutting at the last whole word.
+        
+        Args:
+            text: Text to truncate
+            max_tokens: Approximate token budget
+            
+        Returns:
+            The text, shortened with "..." if it exceeded the budget
+        """
+        max_bytes = max_tokens * BYTES_PER_TOKEN
+        encoded = text.encode()
+        if len(encoded) <= max_bytes:
+            return text
+        
+        truncated = encoded[:max_bytes].decode(errors='ignore')
+        return truncated.rsplit(' ', 1)[0] + "..."
@@ -1,13 +1,81 @@
+import asyncio
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 import re
-from typing import List, Dict, Any
+from urllib.parse import urlsplit
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    # selectolax is optional; article pages are parsed with BeautifulSoup + lxml instead
+    HTMLParser = None
+
+# Class names that usually mark the main article container
+ARTICLE_CLASS_PATTERN = re.compile(r'article|content|story')
+ARTICLE_CONTAINER_SELECTOR = 'div[class*=article], div[class*=content], div[class*=story]'
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Downloads stop at the end of the first <article> element, or at this size
+ARTICLE_END_PATTERN = re.compile(rb'</article\s*>', re.IGNORECASE)
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Domains that are known to be JS-heavy and difficult to scrape
+JS_HEAVY_DOMAINS = frozenset({
+    'bloomberg.com',
+    'wsj.com',
+    'ft.com',
+    'nytimes.com',
+    'washingtonpost.com'
+})
+
+# Network-level failures that are worth retrying
+TRANSIENT_HTTP_ERRORS = (
+    httpx.NetworkError,
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.PoolTimeout
+)
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    Check whether a failed article download is worth retrying.
+    
+    Rate limiting (429), server errors and network failures are retried;
+    other 4xx responses will not change on a retry and fail immediately.
+    
+    Args:
+        exc: Exception raised while downloading
+        
+    Returns:
+        True if the request should be retried
+    """
+    response = getattr(exc, 'response', None)
+    if isinstance(exc, httpx.HTTPError) and response is not None:
+        return response.status_code == 429 or response.status_code >= 500
+    return isinstance(exc, TRANSIENT_HTTP_ERRORS)
 
 class NewsScraper:
     def __init__(self):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        
+        # Pooled keep-alive session for the synchronous search requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def search_google_news(self, company_name: str, num_articles: int = 10) -> List[str]:
         """
@@ -23,7 +91,7 @@ class NewsScraper:
         search_url = f"https://www.google.com/search?q={company_name}+news&tbm=nws"
         
         try:
-            response = requests.get(search_url, headers=self.headers)
+            response = self.session.get(search_url, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -64,61 +132,49 @@ class NewsScraper:
         Returns:
             True if the site is JS-heavy, False otherwise
         """
-        # List of domains that are known to be JS-heavy
-        js_heavy_domains = [
-            'bloomberg.com',
-            'wsj.com',
-            'ft.com',
-            'nytimes.com',
-            'washingtonpost.com'
-        ]
+        hostname = (urlsplit(url).hostname or '').lower()
         
-        return any(domain in url for domain in js_heavy_domains)
+        # Match the domain itself and any of its subdomains (e.g. www.ft.com)
+        labels = hostname.split('.')
+        return any('.'.join(labels[i:]) in JS_HEAVY_DOMAINS for i in range(len(labels) - 1))
     
-    def extract_article_content(self, url: str) -> Dict[str, Any]:
+    async def extract_articles(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract title and content from several news articles concurrently.
+        
+        A single HTTP/2 client is shared across all URLs so connections are
+        pooled and multiplexed.
+        
+        Args:
+            urls: URLs of the articles
+            
+        Returns:
+            List of article dictionaries, in the same order as the URLs
+        """
+        async with httpx.AsyncClient(headers=self.headers, http2=True, timeout=10) as client:
+            return await asyncio.gather(*(self.extract_article_content(url, client) for url in urls))
+    
+    async def extract_article_content(self, url: str, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
         """
         Extract title and content from a news article.
         
         Args:
             url: URL of the article
+            client: Shared HTTP client; a short-lived one is created if omitted
             
         Returns:
             Dictionary containing article title and content
         """
+        if client is None:
+            async with httpx.AsyncClient(headers=self.headers, http2=True, timeout=10) as client:
+                return await self.extract_article_content(url, client)
+        
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            html, encoding = await self._fetch(client, url)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract title
-            title = ''
-            title_elem = soup.find('title')
-            if title_elem:
-                title = title_elem.text.strip()
-            
-            # Extract article content
-            # First try to find article content in common containers
-            content = ''
-            article_elem = soup.find('article') or soup.find('div', class_=re.compile(r'article|content|story')) 
-            
-            if article_elem:
-                # Get all paragraphs from the article element
-                paragraphs = article_elem.find_all('p')
-                content = ' '.join([p.text.strip() for p in paragraphs])
-            else:
-                # Fallback: get all paragraphs from the body
-                paragraphs = soup.find_all('p')
-                content = ' '.join([p.text.strip() for p in paragraphs])
-            
-            # Clean up the content
-            content = re.sub(r'\s+', ' ', content).strip()
-            
-            return {
-                'title': title,
-                'content': content,
-                'url': url
-            }
+            # Parse off the event loop so other downloads keep progressing
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._parse_article, html, url, encoding)
         
         except Exception as e:
             print(f"Error extracting article content from {url}: {e}")
@@ -126,4 +182,128 @@ class NewsScraper:
                 'title': '',
                 'content': '',
                 'url': url
-            }
\ No newline at end of file
+            }
+    
+    @retry(
+        retry=retry_if_exception(_is_transient_error),
+        wait=wait_exponential_jitter(1, 30),
+        stop=stop_after_attempt(4),
+        reraise=True
+    )
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Tuple[bytes, Optional[str]]:
+        """
+        Download a page, retrying transient failures with exponential backoff.
+        
+        The body is streamed and the download stops as soon as the first
+        article element is closed (everything the parser needs comes before
+        it) or MAX_PAGE_BYTES is reached, which keeps peak memory low.
+        
+        Args:
+            client: Shared HTTP client
+            url: URL to download
+            
+        Returns:
+            Tuple of (html, encoding) with the raw HTML bytes of the page and the
+            charset declared in its Content-Type header, if any
+        """
+        chunks = []
+        size = 0
+        tail = b''
+        
+        async with client.stream('GET', url) as response:
+            response.raise_for_status()
+            
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                
+                # Include the previous chunk's tail in case the closing tag straddles chunks
+                if ARTICLE_END_PATTERN.search(tail + chunk) or size >= MAX_PAGE_BYTES:
+                    break
+                tail = chunk[-16:]
+            
+            encoding = response.charset_encoding
+        
+        return b''.join(chunks), encoding
+    
+    def _parse_article(self, html: bytes, url: str, encoding: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parse the title and body text out of an article's HTML.
+        
+        Args:
+            html: Raw HTML of the article page
+            url: URL of the article
+            encoding: Charset from the HTTP headers; the page's own declaration is used if omitted
+            
+        Returns:
+            Dictionary containing article title and content
+        """
+        if HTMLParser is not None:
+            title, content = self._parse_with_selectolax(html, encoding)
+        else:
+            title, content = self._parse_with_soup(html, encoding)
+        
+        # Clean up the content
+        content = WHITESPACE_PATTERN.sub(' ', content).strip()
+        
+        return {
+            'title': title,
+            'content': content,
+            'url': url
+        }
+    
+    def _parse_with_selectolax(self, html: bytes, encoding: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Extract the title and paragraph text using selectolax's C parser.
+        
+        Args:
+            html: Raw HTML of the article page
+            encoding: Charset from the HTTP headers, if any
+            
+        Returns:
+            Tuple of (title, content)
+        """
+        # A header charset takes precedence; otherwise selectolax detects it from the bytes
+        if encoding:
+            try:
+                html = html.decode(encoding, 'replace')
+            except LookupError:
+                pass
+        tree = HTMLParser(html)
+        
+        # Extract title
+        title_elem = tree.css_first('title')
+        title = title_elem.text().strip() if title_elem else ''
+        
+        # Prefer the article container, falling back to every paragraph on the page
+        article_elem = tree.css_first('article') or tree.css_first(ARTICLE_CONTAINER_SELECTOR)
+        paragraphs = (article_elem or tree).css('p')
+        content = ' '.join([p.text().strip() for p in paragraphs])
+        
+        return title, content
+    
+    def _parse_with_soup(self, html: bytes, encoding: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Extract the title and paragraph text using BeautifulSoup with lxml.
+        
+        Args:
+            html: Raw HTML of the article page
+            encoding: Charset from the HTTP headers, if any
+            
+        Returns:
+            Tuple of (title, content)
+        """
+        soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+        
+        # Extract title
+        title = ''
+        title_elem = soup.find('title')
+        if title_elem:
+            title = title_elem.text.strip()
+        
+        # Prefer the article container, falling back to every paragraph on the page
+        article_elem = soup.find('article') or soup.find('div', class_=ARTICLE_CLASS_PATTERN)
+        paragraphs = (article_elem or soup).find_all('p')
+        content = ' '.join([p.text.strip() for p in paragraphs])
+        
+        return title, content
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import threading
+import orjson
+import zstandard as zstd
+from typing import Dict, Any
+
+# Extension of the compressed analysis files written by the cron job
+ANALYSIS_EXTENSION = '.json.zst'
+
+# Extension of the pre-rendered Hindi audio stored next to each analysis
+AUDIO_EXTENSION = '.mp3'
+
+# zstd level 3 shrinks the JSON several times and still decompresses at ~1 GB/s
+COMPRESSION_LEVEL = 3
+
+# Compression contexts must not be shared by concurrent threads, so keep one per thread
+_contexts = threading.local()
+
+def _compressor() -> zstd.ZstdCompressor:
+    """Get this thread's zstd compressor"""
+    if not hasattr(_contexts, 'compressor'):
+        _contexts.compressor = zstd.ZstdCompressor(level=COMPRESSION_LEVEL)
+    return _contexts.compressor
+
+def _decompressor() -> zstd.ZstdDecompressor:
+    """Get this thread's zstd decompressor"""
+    if not hasattr(_contexts, 'decompressor'):
+        _contexts.decompressor = zstd.ZstdDecompressor()
+    return _contexts.decompressor
+
+def save_analysis(path: str, analysis: Dict[str, Any]) -> None:
+    """
+    Save an analysis as zstd-compressed JSON.
+    
+    Args:
+        path: Destination file path
+        analysis: Analysis dictionary to save
+    """
+    data = _compressor().compress(orjson.dumps(analysis, option=orjson.OPT_SERIALIZE_NUMPY))
+    write_atomic(path, data)
+
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    Replace a file's contents so readers see either the old or the new file, never a partial one.
+    
+    Args:
+        path: Destination file path
+        data: New contents of the file
+    """
+    # The temporary file must be on the same filesystem for os.replace to be atomic
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.tmp_')
+    try:
+        # A large write buffer keeps big payloads to a few syscalls
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+            f.write(data)
+        
+        # mkstemp creates the file owner-only; keep it readable like a normally written file
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+def read_analysis_json(path: str) -> bytes:
+    """
+    Read a saved analysis as raw (decompressed) JSON bytes.
+    
+    Args:
+        path: Path of the compressed analysis file
+        
+    Returns:
+        The analysis JSON document
+    """
+    with open(path, 'rb') as f:
+        return _decompressor().decompress(f.read())
@@ -1,13 +1,281 @@
-from gtts import gTTS
-from googletrans import Translator
+import requests
+from requests.adapters import HTTPAdapter
+import asyncio
 import os
+import re
+import hashlib
+import io
+import logging
 import tempfile
-from typing import Tuple
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Iterator, List
+from diskcache import Cache, Deque
+
+logger = logging.getLogger(__name__)
+
+# How long cached translations and audio stay valid
+TTS_CACHE_EXPIRE = 72 * 3600
+
+# Number of recently used translations also kept in memory, in front of the disk cache
+HOT_TRANSLATIONS = 2048
+
+# Cap on concurrent requests to Google's translation and TTS endpoints
+MAX_CONCURRENT_REQUESTS = 8
+
+# Sentence ends in English and Hindi (danda), and the size of each TTS request
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?\u0964])\s+')
+TTS_CHUNK_CHARS = 100
+
+# Coalesce the many small MP3 chunk writes into at most 1 MiB write() calls
+AUDIO_WRITE_BUFFER = 1 << 20
+
+# Local Piper voice used when TTS_ENGINE=piper (requires piper-tts and lameenc)
+DEFAULT_PIPER_VOICE = "models/hi_IN-priyamvada-medium.onnx"
+PIPER_LANG = 'hi'
+PIPER_MP3_BITRATE = 64
+
+# Compact audio (TTS_COMPACT_AUDIO=1) re-encodes speech as 16 kHz / 24 kbps mono MP3,
+# which sounds the same for speech and is roughly a quarter smaller (gTTS needs pydub and ffmpeg)
+COMPACT_SAMPLE_RATE = 16000
+COMPACT_MP3_BITRATE = 24
+
+# Timeout for each request to Google's translation endpoint
+TRANSLATE_TIMEOUT = 10.0
+
+# Batched translations join several texts into one request to the free Google
+# endpoint; the separator survives translation, so the result can be split again
+BATCH_TRANSLATE_URL = 'https://translate.googleapis.com/translate_a/single'
+BATCH_SEPARATOR = '\n---||---\n'
+BATCH_SEPARATOR_PATTERN = re.compile(r'\s*-{3}\s*\|\s*\|\s*-{3}\s*')
+MAX_TRANSLATE_CHARS = 5000
+
+# Long texts are translated as sentence-aligned shards of at most this size
+TRANSLATE_SHARD_CHARS = 4500
+
+# Text with more than this fraction of Devanagari characters is treated as Hindi already
+HINDI_CHAR_THRESHOLD = 0.3
+
+class _KeepAliveSession(requests.Session):
+    """requests.Session that stays open when used as a context manager"""
+    
+    def __exit__(self, *args) -> None:
+        # Keep the pooled connections alive for the next gTTS request
+        pass
+
+class _SharedSessionRequests:
+    """Stand-in for the requests module inside gTTS that hands out one shared session"""
+    
+    def __init__(self, session: requests.Session):
+        self._session = session
+    
+    def Session(self) -> requests.Session:
+        return self._session
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+
+# gTTS and googletrans (with httpx) are slow to import, so they are loaded by
+# the first TextToSpeechService rather than when this module is imported
+gTTS = None
+Translator = None
+Timeout = None
+_tts_session = None
+_lazy_lock = threading.Lock()
+
+def _lazy() -> None:
+    """Import gTTS and googletrans on first use and route gTTS through a pooled session"""
+    global gTTS, Translator, Timeout, _tts_session
+    if gTTS is not None:
+        return
+    
+    # Services may be created from several threads; only one runs the imports and the patch
+    with _lazy_lock:
+        if gTTS is not None:
+            return
+        
+        import gtts.tts
+        import httpx
+        from googletrans import Translator as _Translator
+        
+        # gTTS opens a fresh requests.Session (and TLS connection) for every request;
+        # route them through one pooled keep-alive session instead
+        _tts_session = _KeepAliveSession()
+        _tts_session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        gtts.tts.requests = _SharedSessionRequests(_tts_session)
+        
+        # gTTS is assigned last, since the unlocked check above treats it as the ready flag
+        Translator, Timeout = _Translator, httpx.Timeout
+        gTTS = gtts.tts.gTTS
+
+def _cache_key(*parts) -> str:
+    """Build a cache key from the SHA-256 of the given parts"""
+    return hashlib.sha256('|'.join(str(part) for part in parts).encode()).hexdigest()
+
+def _pack_sentences(text: str, max_chars: int) -> List[str]:
+    """
+    Split text on sentence boundaries and greedily pack the sentences into chunks.
+    
+    A single sentence longer than max_chars becomes a chunk of its own.
+    
+    Args:
+        text: Text to split
+        max_chars: Preferred maximum length of each chunk
+        
+    Returns:
+        List of chunks, in order
+    """
+    chunks = []
+    current = ''
+    for sentence in SENTENCE_BOUNDARY_PATTERN.split(text.strip()):
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f'{current} {sentence}' if current else sentence
+    
+    if current:
+        chunks.append(current)
+    return chunks
+
+def _is_hindi(text: str) -> bool:
+    """Check whether text is mostly written in Devanagari (U+0900 to U+097F)"""
+    devanagari = sum(1 for c in text if '\u0900' <= c <= '\u097f')
+    return devanagari > HINDI_CHAR_THRESHOLD * len(text)
+
+def _resample_pcm16(pcm: bytes, in_rate: int, out_rate: int) -> bytes:
+    """
+    Resample 16-bit mono PCM by linear interpolation.
+    
+    Args:
+        pcm: Little-endian 16-bit mono samples
+        in_rate: Sample rate of pcm
+        out_rate: Target sample rate
+        
+    Returns:
+        The resampled PCM
+    """
+    import numpy as np
+    
+    samples = np.frombuffer(pcm, dtype='<i2').astype(np.float32)
+    count = int(len(samples) * out_rate / in_rate)
+    positions = np.arange(count) * (in_rate / out_rate)
+    resampled = np.interp(positions, np.arange(len(samples)), samples)
+    return np.round(resampled).astype('<i2').tobytes()
+
+def _batch_by_length(texts: List[str], max_chars: int) -> List[List[int]]:
+    """
+    Group consecutive texts into batches whose joined length fits in max_chars.
+    
+    A single text longer than max_chars becomes a batch of its own.
+    
+    Args:
+        texts: Texts to group
+        max_chars: Maximum length of each joined batch
+        
+    Returns:
+        List of batches, each a list of indices into texts
+    """
+    batches = []
+    current = []
+    size = 0
+    for i, text in enumerate(texts):
+        added = len(text) + (len(BATCH_SEPARATOR) if current else 0)
+        if current and size + added > max_chars:
+            batches.append(current)
+            current, size = [], 0
+            added = len(text)
+        current.append(i)
+        size += added
+    
+    if current:
+        batches.append(current)
+    return batches
 
 class TextToSpeechService:
-    def __init__(self):
-        """Initialize the Text-to-Speech service"""
-        self.translator = Translator()
+    def __init__(self, cache_dir: str = "data/tts_cache", engine: str = None, compact_audio: bool = None):
+        """
+        Initialize the Text-to-Speech service.
+        
+        Args:
+            cache_dir: Directory for the on-disk caches of translations and audio
+            engine: Speech engine, "gtts" (Google, default) or "piper" (local ONNX
+                voice); defaults to the TTS_ENGINE environment variable
+            compact_audio: Produce smaller 16 kHz / 24 kbps MP3s; defaults to the
+                TTS_COMPACT_AUDIO environment variable
+        """
+        _lazy()
+        # googletrans assigns this straight to its httpx client, which needs a Timeout object
+        self.translator = Translator(timeout=Timeout(TRANSLATE_TIMEOUT))
+        
+        # googletrans keeps one HTTP/2 client for all requests; expose it for reuse
+        self.http_client = self.translator.client
+        self.translation_cache = Cache(os.path.join(cache_dir, 'translations'))
+        self.speech_cache = Cache(os.path.join(cache_dir, 'speech'))
+        
+        # In-memory LRU of the hottest translations; batch workers share it, hence the lock
+        self.hot_translations = OrderedDict()
+        self.hot_lock = threading.Lock()
+        
+        # Keys of the most recently stored translations, used to warm the LRU on startup
+        self.recent_translations = Deque(directory=os.path.join(cache_dir, 'recent_translations'), maxlen=HOT_TRANSLATIONS)
+        self._load_hot_translations()
+        
+        # Audio files are written here and the directory is removed when the process exits
+        self._tmp = tempfile.TemporaryDirectory(prefix='tts_')
+        
+        # googletrans and gTTS are blocking, so batches fan out over a thread pool;
+        # the per-chunk TTS and translation requests get their own pool so batch workers never wait on themselves
+        self.pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        self.chunk_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        
+        # The local Piper voice avoids the network round trip to Google entirely
+        self.engine = engine or os.getenv("TTS_ENGINE", "gtts")
+        self.piper_voice = None
+        self.piper_lock = threading.Lock()
+        if self.engine == "piper":
+            try:
+                import piper.voice
+                import lameenc
+            except ImportError as e:
+                logger.warning("Piper TTS is unavailable, falling back to gTTS: %s", e)
+                self.engine = "gtts"
+        
+        # Smaller audio means less bandwidth to mobile clients
+        self.compact_audio = compact_audio if compact_audio is not None else os.getenv("TTS_COMPACT_AUDIO") == "1"
+        if self.compact_audio and self.engine != "piper":
+            try:
+                from pydub.utils import which
+            except ImportError as e:
+                logger.warning("pydub is unavailable, serving gTTS audio as-is: %s", e)
+                self.compact_audio = False
+            else:
+                # pydub imports fine without ffmpeg but cannot decode or encode anything
+                if not which("ffmpeg"):
+                    logger.warning("ffmpeg is unavailable, serving gTTS audio as-is")
+                    self.compact_audio = False
+        
+        # Open the pooled connections in the background so the first real request skips the handshakes
+        threading.Thread(target=self._warmup, name='tts-warmup', daemon=True).start()
+    
+    def _warmup(self) -> None:
+        """
+        Issue throwaway requests that open the keep-alive connections used later.
+        
+        Failures are ignored; the real requests simply pay the connection setup instead.
+        """
+        try:
+            self.translator.translate('hi', dest='hi')
+            if self.engine == "piper":
+                self._load_piper_voice()
+            else:
+                gTTS(text='a', lang='hi').write_to_fp(io.BytesIO())
+        except Exception as e:
+            logger.debug("TTS warmup failed: %s", e)
     
     def translate_to_hindi(self, text: str) -> str:
         """
@@ -19,18 +287,162 @@ class TextToSpeechService:
         Returns:
             Hindi translation of the text
         """
+        # Already-translated text (e.g. re-served articles) needs no round trip
+        if _is_hindi(text):
+            return text
+        
+        cached = self._get_cached_translation(text)
+        if cached is not None:
+            return cached
+        
         try:
-            # Strip the text to avoid issues with long inputs
-            if len(text) > 5000:
-                text = text[:5000] + "..."
-                
-            translation = self.translator.translate(text, dest='hi')
-            return translation.text
+            # Translate long texts in parallel sentence-aligned shards instead of truncating them
+            shards = _pack_sentences(text, TRANSLATE_SHARD_CHARS)
+            translation = ' '.join(self.chunk_pool.map(self._translate_shard, shards))
+            self._cache_translation(text, translation)
+            return translation
         except Exception as e:
-            print(f"Error translating text to Hindi: {e}")
+            logger.warning("Error translating text to Hindi: %s", e)
             return text  # Return original text if translation fails
     
-    def text_to_speech(self, text: str, lang: str = 'hi') -> Tuple[str, str]:
+    def _load_hot_translations(self) -> None:
+        """
+        Prime the in-memory LRU with the most recently stored translations on disk.
+        
+        Values are read through the disk cache, so entries that have expired
+        since they were stored are skipped.
+        """
+        # The deque runs oldest to newest, so the newest end up as the most recently used
+        for cache_key in self.recent_translations:
+            translation, expire_time = self.translation_cache.get(cache_key, expire_time=True)
+            if translation is not None:
+                self._remember_translation(cache_key, translation, expire_time)
+    
+    def _get_cached_translation(self, text: str) -> str:
+        """
+        Look up a translation in memory first, then on disk.
+        
+        Args:
+            text: English text
+            
+        Returns:
+            The cached Hindi translation, or None if it has not been translated yet
+        """
+        cache_key = _cache_key('hi', text)
+        with self.hot_lock:
+            entry = self.hot_translations.get(cache_key)
+            if entry is not None:
+                translation, expire_time = entry
+                
+                # Hot entries expire together with their copy on disk
+                if expire_time is None or expire_time > time.time():
+                    self.hot_translations.move_to_end(cache_key)
+                    return translation
+                del self.hot_translations[cache_key]
+        
+        translation, expire_time = self.translation_cache.get(cache_key, expire_time=True)
+        if translation is not None:
+            self._remember_translation(cache_key, translation, expire_time)
+        return translation
+    
+    def _cache_translation(self, text: str, translation: str) -> None:
+        """
+        Store a translation on disk and in memory.
+        
+        Args:
+            text: English text
+            translation: Its Hindi translation
+        """
+        cache_key = _cache_key('hi', text)
+        self.translation_cache.set(cache_key, translation, expire=TTS_CACHE_EXPIRE)
+        self.recent_translations.append(cache_key)
+        self._remember_translation(cache_key, translation, time.time() + TTS_CACHE_EXPIRE)
+    
+    def _remember_translation(self, cache_key: str, translation: str, expire_time: float) -> None:
+        """Add a translation to the in-memory LRU, evicting the least recently used one"""
+        with self.hot_lock:
+            self.hot_translations[cache_key] = (translation, expire_time)
+            self.hot_translations.move_to_end(cache_key)
+            if len(self.hot_translations) > HOT_TRANSLATIONS:
+                self.hot_translations.popitem(last=False)
+    
+    def _translate_shard(self, text: str) -> str:
+        """
+        Translate a single shard of text to Hindi with googletrans.
+        
+        Args:
+            text: English text of at most TRANSLATE_SHARD_CHARS, unless it is one long sentence
+            
+        Returns:
+            Hindi translation of the shard
+        """
+        # A single sentence can still exceed the endpoint's limit
+        if len(text) > MAX_TRANSLATE_CHARS:
+            text = text[:MAX_TRANSLATE_CHARS] + "..."
+        return self.translator.translate(text, dest='hi').text
+    
+    def translate_many_to_hindi(self, texts: List[str]) -> List[str]:
+        """
+        Translate several texts from English to Hindi in as few requests as possible.
+        
+        Uncached texts are joined into batches of up to MAX_TRANSLATE_CHARS and
+        each batch is translated with a single request. If a batch cannot be
+        split back into the original texts, its texts are translated one by one.
+        
+        Args:
+            texts: English texts to translate
+            
+        Returns:
+            Hindi translations, in the same order as the texts
+        """
+        results = [text if _is_hindi(text) else self._get_cached_translation(text) for text in texts]
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        for batch in _batch_by_length([texts[i] for i in pending], MAX_TRANSLATE_CHARS):
+            indices = [pending[i] for i in batch]
+            batch_texts = [texts[i] for i in indices]
+            
+            translations = self._translate_batch(batch_texts) if len(batch_texts) > 1 else None
+            if translations is None:
+                translations = [self.translate_to_hindi(text) for text in batch_texts]
+            else:
+                for text, translation in zip(batch_texts, translations):
+                    self._cache_translation(text, translation)
+            
+            for i, translation in zip(indices, translations):
+                results[i] = translation
+        
+        return results
+    
+    def _translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate several texts to Hindi with one request to Google's endpoint.
+        
+        Args:
+            texts: English texts to translate
+            
+        Returns:
+            Hindi translations in the same order, or None if the request failed
+            or the response could not be split back into one piece per text
+        """
+        try:
+            response = self.http_client.post(
+                BATCH_TRANSLATE_URL,
+                params={'client': 'gtx', 'sl': 'auto', 'tl': 'hi', 'dt': 't'},
+                data={'q': BATCH_SEPARATOR.join(texts)}
+            )
+            response.raise_for_status()
+            
+            # The translation comes back as a list of [translated, original, ...] segments
+            translated = ''.join(segment[0] for segment in response.json()[0] if segment[0])
+        except Exception as e:
+            logger.warning("Error batch translating text to Hindi: %s", e)
+            return None
+        
+        parts = BATCH_SEPARATOR_PATTERN.split(translated.strip())
+        return parts if len(parts) == len(texts) else None
+    
+    def text_to_speech(self, text: str, lang: str = 'hi') -> str:
         """
         Convert text to speech and save as an audio file.
         
@@ -39,20 +451,260 @@ class TextToSpeechService:
             lang: Language code (default is Hindi 'hi')
             
         Returns:
-            Tuple of (file_path, temp_dir) where file_path is the path to the audio file
-            and temp_dir is the temporary directory that should be cleaned up later
+            Path to the audio file inside the service's temporary directory, which
+            the caller should remove once done, or None if generation failed
+        """
+        # Unique file in the service's own temporary directory, no directory per call
+        file_path = os.path.join(self._tmp.name, f'{uuid.uuid4().hex}.mp3')
+        
+        try:
+            # Write the audio frames as they arrive
+            with open(file_path, 'wb', buffering=AUDIO_WRITE_BUFFER) as f:
+                for chunk in self.iter_speech_chunks(text, lang):
+                    f.write(chunk)
+            
+            return file_path
+        
+        except Exception as e:
+            logger.warning("Error generating speech: %s", e)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            return None
+    
+    def text_to_speech_bytes(self, text: str, lang: str = 'hi') -> bytes:
+        """
+        Convert text to speech in memory, without touching the filesystem.
+        
+        Args:
+            text: Text to convert to speech
+            lang: Language code (default is Hindi 'hi')
+            
+        Returns:
+            The MP3 audio, or None if generation failed
         """
         try:
-            # Create a temporary directory to store the audio file
-            temp_dir = tempfile.mkdtemp()
-            file_path = os.path.join(temp_dir, 'speech.mp3')
+            return b''.join(self.iter_speech_chunks(text, lang))
+        except Exception as e:
+            logger.warning("Error generating speech: %s", e)
+            return None
+    
+    async def text_to_speech_stream(self, text: str, lang: str = 'hi') -> AsyncIterator[bytes]:
+        """
+        Convert text to speech asynchronously, yielding MP3 data as it becomes available.
+        
+        Suitable for a StreamingResponse: the first chunk can be sent to the
+        client while the rest of the audio is still being synthesized.
+        
+        Args:
+            text: Text to convert to speech
+            lang: Language code (default is Hindi 'hi')
+            
+        Yields:
+            Consecutive pieces of the MP3 audio
+        """
+        loop = asyncio.get_running_loop()
+        chunks = self.iter_speech_chunks(text, lang)
+        
+        # Advance the blocking generator on the thread pool so the event loop stays free
+        while True:
+            chunk = await loop.run_in_executor(self.pool, next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+    
+    def iter_speech_chunks(self, text: str, lang: str = 'hi') -> Iterator[bytes]:
+        """
+        Convert text to speech, yielding MP3 data as it becomes available.
+        
+        The text is split on sentence boundaries and the chunks are synthesized
+        in parallel; MP3 frames can simply be concatenated, so each chunk is
+        yielded in order as soon as it (and everything before it) is ready.
+        
+        Args:
+            text: Text to convert to speech
+            lang: Language code (default is Hindi 'hi')
+            
+        Yields:
+            Consecutive pieces of the MP3 audio
+        """
+        # Reuse previously generated audio for the same text
+        cache_key = _cache_key(self.engine, lang, self.compact_audio, text)
+        audio = self.speech_cache.get(cache_key)
+        if audio is not None:
+            yield audio
+            return
+        
+        parts = _pack_sentences(text, TTS_CHUNK_CHARS)
+        if not parts:
+            raise ValueError("No text to speak")
+        
+        futures = [self.chunk_pool.submit(self._synthesize_chunk, part, lang) for part in parts]
+        
+        # Compact gTTS audio is re-encoded as a whole, so it can only be yielded once complete
+        if self.compact_audio and not (self.engine == "piper" and lang == PIPER_LANG):
+            audio = self._compact_mp3(b''.join(future.result() for future in futures))
+            self.speech_cache.set(cache_key, audio, expire=TTS_CACHE_EXPIRE)
+            yield audio
+            return
+        
+        chunks = []
+        for future in futures:
+            chunk = future.result()
+            chunks.append(chunk)
+            yield chunk
+        
+        self.speech_cache.set(cache_key, b''.join(chunks), expire=TTS_CACHE_EXPIRE)
+    
+    def _synthesize_chunk(self, text: str, lang: str) -> bytes:
+        """
+        Synthesize a single chunk of text with the configured engine.
+        
+        Args:
+            text: Chunk of text to convert to speech
+            lang: Language code
             
-            # Generate the speech and save to file
-            tts = gTTS(text=text, lang=lang, slow=False)
-            tts.save(file_path)
+        Returns:
+            MP3 data for the chunk
+        """
+        # The Piper voice only speaks its own language; anything else goes to gTTS
+        if self.engine == "piper" and lang == PIPER_LANG:
+            return self._synthesize_chunk_piper(text)
+        
+        return b''.join(gTTS(text=text, lang=lang, slow=False).stream())
+    
+    def _compact_mp3(self, audio: bytes) -> bytes:
+        """
+        Re-encode gTTS audio at COMPACT_SAMPLE_RATE and COMPACT_MP3_BITRATE.
+        
+        The whole clip is transcoded in one pass, which needs a single ffmpeg
+        decode/encode and leaves no encoder padding between sentence chunks.
+        
+        Args:
+            audio: Complete MP3 data from gTTS
             
-            return file_path, temp_dir
+        Returns:
+            The smaller MP3 data, or the original audio if transcoding failed
+        """
+        from pydub import AudioSegment
         
+        try:
+            segment = AudioSegment.from_file(io.BytesIO(audio), format='mp3')
+            output = io.BytesIO()
+            segment.set_frame_rate(COMPACT_SAMPLE_RATE).set_channels(1).export(
+                output,
+                format='mp3',
+                bitrate=f'{COMPACT_MP3_BITRATE}k'
+            )
+            return output.getvalue()
         except Exception as e:
-            print(f"Error generating speech: {e}")
-            return None, None
\ No newline at end of file
+            logger.warning("Error compacting audio, serving it as-is: %s", e)
+            return audio
+    
+    def _synthesize_chunk_piper(self, text: str) -> bytes:
+        """
+        Synthesize a single chunk of text with the local Piper voice.
+        
+        Args:
+            text: Chunk of text to convert to speech
+            
+        Returns:
+            MP3 data for the chunk
+        """
+        import lameenc
+        
+        voice = self._load_piper_voice()
+        
+        # espeak-ng's phonemizer keeps process-global state, so only one chunk is
+        # synthesized at a time; the voice is local, so parallelism gains nothing anyway
+        with self.piper_lock:
+            pcm = b''.join(voice.synthesize_stream_raw(text))
+        
+        sample_rate = voice.config.sample_rate
+        if self.compact_audio and sample_rate != COMPACT_SAMPLE_RATE:
+            pcm = _resample_pcm16(pcm, sample_rate, COMPACT_SAMPLE_RATE)
+            sample_rate = COMPACT_SAMPLE_RATE
+        
+        # Piper produces 16-bit mono PCM; the rest of the app serves MP3
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(COMPACT_MP3_BITRATE if self.compact_audio else PIPER_MP3_BITRATE)
+        encoder.set_in_sample_rate(sample_rate)
+        encoder.set_channels(1)
+        return bytes(encoder.encode(pcm) + encoder.flush())
+    
+    def _load_piper_voice(self):
+        """
+        Load the Piper voice model on first use.
+        
+        The model path comes from the PIPER_VOICE environment variable, and
+        PIPER_USE_CUDA=1 runs it on the CUDA execution provider.
+        
+        Returns:
+            The loaded piper.voice.PiperVoice
+        """
+        with self.piper_lock:
+            if self.piper_voice is None:
+                from piper.voice import PiperVoice
+                self.piper_voice = PiperVoice.load(
+                    os.getenv("PIPER_VOICE", DEFAULT_PIPER_VOICE),
+                    use_cuda=os.getenv("PIPER_USE_CUDA") == "1"
+                )
+            return self.piper_voice
+    
+    async def translate_many(self, texts: List[str]) -> List[str]:
+        """
+        Translate several texts from English to Hindi concurrently.
+        
+        Args:
+            texts: English texts to translate
+            
+        Returns:
+            Hindi translations, in the same order as the texts
+        """
+        return await self._gather_in_pool(self.translate_to_hindi, texts)
+    
+    async def text_to_speech_many(self, texts: List[str], lang: str = 'hi') -> List[str]:
+        """
+        Convert several texts to speech concurrently.
+        
+        Args:
+            texts: Texts to convert to speech
+            lang: Language code (default is Hindi 'hi')
+            
+        Returns:
+            Paths of the audio files, in the same order as the texts
+        """
+        return await self._gather_in_pool(lambda text: self.text_to_speech(text, lang), texts)
+    
+    async def _gather_in_pool(self, func: Callable[[str], Any], texts: List[str]) -> List[Any]:
+        """
+        Run a blocking function over several texts on the thread pool.
+        
+        Args:
+            func: Blocking function to call with each text
+            texts: Texts to process
+            
+        Returns:
+            Results of func, in the same order as the texts
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def run_one(text: str) -> Any:
+            # Bound in-flight requests to avoid being throttled by Google
+            async with semaphore:
+                return await loop.run_in_executor(self.pool, func, text)
+        
+        return await asyncio.gather(*(run_one(text) for text in texts))
+
+@lru_cache(maxsize=1)
+def get_service() -> TextToSpeechService:
+    """
+    Get the process-wide Text-to-Speech service.
+    
+    The translator, HTTP clients, caches and thread pools are created once on
+    first use and shared by every caller afterwards.
+    
+    Returns:
+        The shared TextToSpeechService
+    """
+    return TextToSpeechService()